@@ -172,7 +172,7 @@ def np_to_pa_dtype(dtype):
 def apply_reduce(fn, inp):
     # allocate output+temp array
     outsz = libgdf.gdf_reduce_optimal_output_size()
-    out = cuda.device_array(outsz, dtype=inp.dtype)
+    out = cudautils.device_array(outsz, dtype=inp.dtype)
     # call reduction
     fn(inp.cffi_view, unwrap_devary(out), outsz)
     # return 1st element
@@ -456,7 +456,7 @@ class SegmentedRadixortPlan(object):
         seg_dtype = np.uint32
         segsize_limit = 2 ** 16 - 1
 
-        d_fullsegs = cuda.device_array(segments.size + 1, dtype=seg_dtype)
+        d_fullsegs = cudautils.device_array(segments.size + 1, dtype=seg_dtype)
         d_begins = d_fullsegs[:-1]
         d_ends = d_fullsegs[1:]
 
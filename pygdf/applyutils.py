@@ -93,7 +93,7 @@ class ApplyKernelCompilerBase(object):
         # Allocate output columns
         outputs = {}
         for k, dt in self.outcols.items():
-            outputs[k] = cuda.device_array(len(df), dtype=dt)
+            outputs[k] = cudautils.device_array(len(df), dtype=dt)
         # Bind argument
         args = {}
         for dct in [inputs, outputs, self.kwargs]:
@@ -1,6 +1,5 @@
 
 import numpy as np
-from numba import cuda
 
 from . import cudautils, utils
 from .serialize import register_distributed_serializer
@@ -10,6 +9,7 @@ class Buffer(object):
     """A 1D gpu buffer.
     """
     _cached_ipch = None
+    _cached_host = None
 
     @classmethod
     def from_empty(cls, mem):
@@ -21,7 +21,7 @@ class Buffer(object):
     def null(cls, dtype):
         """Create a "null" buffer with a zero-sized device array.
         """
-        mem = cuda.device_array(0, dtype=dtype)
+        mem = cudautils.device_array(0, dtype=dtype)
         return cls(mem, size=0, capacity=0)
 
     def __init__(self, mem, size=None, capacity=None, categorical=False):
@@ -33,7 +33,8 @@ class Buffer(object):
         if capacity is None:
             capacity = size
         self.mem = cudautils.to_device(mem)
-        _BufferSentry(self.mem).ndim(1)
+        if self.mem.ndim != 1:
+            raise BufferSentryError('ndim mismatch')
         self.size = size
         self.capacity = capacity
         self.dtype = self.mem.dtype
@@ -107,7 +108,7 @@ class Buffer(object):
             # Open IPC handle
             with ipch as data:
                 # Copy remote data over
-                mem = cuda.device_array_like(data)
+                mem = cudautils.device_array_like(data)
                 mem.copy_to_device(data)
         # Not using IPC
         else:
@@ -158,6 +159,7 @@ class Buffer(object):
         array = cudautils.astype(array, dtype=self.dtype)
         self.mem[self.size:].copy_to_device(array)
         self.size += needed
+        self._cached_host = None
 
     def astype(self, dtype):
         if self.dtype == dtype:
@@ -166,7 +168,17 @@ class Buffer(object):
             return Buffer(cudautils.astype(self.mem, dtype=dtype))
 
     def to_array(self):
-        return self.to_gpu_array().copy_to_host()
+        return cudautils.copy_to_host(self.to_gpu_array())
+
+    def to_array_cached(self):
+        """Like ``to_array`` but the host copy is kept and reused until the
+        buffer is extended.  The returned array is read-only.
+        """
+        if self._cached_host is None:
+            host = self.to_array()
+            host.flags.writeable = False
+            self._cached_host = host
+        return self._cached_host
 
     def to_gpu_array(self):
         return self.mem[:self.size]
@@ -191,23 +203,4 @@ class BufferSentryError(ValueError):
     pass
 
 
-class _BufferSentry(object):
-    def __init__(self, buf):
-        self._buf = buf
-
-    def dtype(self, dtype):
-        if self._buf.dtype != dtype:
-            raise BufferSentryError('dtype mismatch')
-        return self
-
-    def ndim(self, ndim):
-        if self._buf.ndim != ndim:
-            raise BufferSentryError('ndim mismatch')
-        return self
-
-    def contig(self):
-        if not self._buf.is_c_contiguous():
-            raise BufferSentryError('non contiguous')
-
-
 register_distributed_serializer(Buffer)
@@ -150,6 +150,17 @@ class CategoricalColumn(columnops.TypedColumnBase):
         val = self.as_numerical.element_indexing(index)
         return self._decode(val) if val is not None else val
 
+    def element_values(self, nrows=None):
+        codes = self.as_numerical.element_values(nrows)
+        ncats = len(self._categories)
+        return [self._categories[v] if v is not None and 0 <= v < ncats
+                else None
+                for v in codes]
+
+    def element_strings(self, nrows=None):
+        return ['' if v is None else str(v)
+                for v in self.element_values(nrows)]
+
     def to_pandas(self, index=None):
         codes = self.cat().codes.fillna(-1).to_array()
         data = pd.Categorical.from_codes(codes,
@@ -305,7 +316,7 @@ def pandas_categorical_as_column(categorical, codes=None):
                   categories=categorical.categories,
                   ordered=categorical.ordered)
     if not np.all(valid_codes):
-        mask = cudautils.compact_mask_bytes(valid_codes)
+        mask = utils.host_compact_mask_bytes(valid_codes)
         nnz = np.count_nonzero(valid_codes)
         null_count = codes.size - nnz
         params.update(dict(mask=Buffer(mask), null_count=null_count))
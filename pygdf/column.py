@@ -7,7 +7,6 @@ LibGDF operates on column.
 from numbers import Number
 
 import numpy as np
-from numba import cuda
 
 from . import _gdf
 from . import cudautils
@@ -30,7 +29,8 @@ class Column(object):
     _mask : Buffer
         The validity mask
     _null_count : int
-        Number of null values in the mask.
+        Number of null values in the mask.  ``None`` until first needed
+        when a mask is given without a count.
 
     These attributes are exported in the properties (e.g. *data*, *mask*,
     *null_count*).
@@ -45,21 +45,27 @@ class Column(object):
         objs = [o for o in objs if len(o) > 0]
         newsize = sum(map(len, objs))
         # Concatenate data
-        mem = cuda.device_array(shape=newsize, dtype=head.data.dtype)
+        mem = cudautils.device_array(shape=newsize, dtype=head.data.dtype)
         data = Buffer.from_empty(mem)
         for o in objs:
             data.extend(o.data.to_gpu_array())
 
         # Concatenate mask if present
         if any(o.has_null_mask for o in objs):
-            # FIXME: Inefficient
-            mem = cuda.device_array(shape=newsize, dtype=np.bool)
-            mask = Buffer.from_empty(mem)
+            # Expand each mask directly into its slice of a single bytemask
+            bytemask = cudautils.device_array(shape=newsize, dtype=np.bool_)
             null_count = 0
+            offset = 0
             for o in objs:
-                mask.extend(o._get_mask_as_column().to_gpu_array())
-                null_count += o._null_count
-            mask = Buffer(cudautils.compact_mask_bytes(mask.to_gpu_array()))
+                end = offset + len(o)
+                if o.has_null_mask:
+                    cudautils.expand_mask_bits(len(o), o.mask.to_gpu_array(),
+                                               out=bytemask[offset:end])
+                else:
+                    cudautils.fill_value(bytemask[offset:end], True)
+                null_count += o.null_count
+                offset = end
+            mask = Buffer(cudautils.compact_mask_bytes(bytemask))
         else:
             mask = None
             null_count = 0
@@ -88,7 +94,8 @@ class Column(object):
         mask : Buffer; optional
             The validity mask
         null_count : int; optional
-            The number of null values in the mask.
+            The number of null values in the mask.  If omitted, it is
+            counted from the mask on first use.
         """
         # Forces Column content to be contiguous
         if not data.is_contiguous():
@@ -104,34 +111,41 @@ class Column(object):
             # check that mask length is sufficient
             assert mask.size * utils.mask_bitsize >= len(self)
 
-        assert null_count is None or null_count >= 0
-        if null_count is None:
-            if self._mask is not None:
-                nnz = _gdf.count_nonzero_mask(self._mask.mem,
-                                              size=len(self))
-                null_count = len(self) - nnz
-                if null_count == 0:
-                    self._mask = None
-            else:
-                null_count = 0
-
-        assert 0 <= null_count <= len(self)
+        assert null_count is None or 0 <= null_count <= len(self)
         if null_count == 0:
             # Remove mask if null_count is zero
             self._mask = None
 
         self._null_count = null_count
+        # Lazily built libgdf view; see ``cffi_view``
+        self._cffi_view = None
+
+    def __getstate__(self):
+        """Pickle without the per-instance caches; they are rebuilt on
+        demand and the libgdf view cannot be pickled at all.
+        """
+        state = self.__dict__.copy()
+        state['_cffi_view'] = None
+        return state
+
+    def _count_nulls(self):
+        """Compute the deferred null count; a mask without nulls is dropped.
+        """
+        nnz = cudautils.popcount_mask(self._mask.mem, size=len(self))
+        self._null_count = len(self) - nnz
+        if self._null_count == 0:
+            self._mask = None
 
     def serialize(self, serialize):
         header = {
-            'null_count': self._null_count,
+            'null_count': self.null_count,
         }
         frames = []
 
         header['data_buffer'], data_frames = serialize(self._data)
         header['data_frame_count'] = len(data_frames)
         frames.extend(data_frames)
-        header['mask_buffer'], mask_frames = serialize(self._mask)
+        header['mask_buffer'], mask_frames = serialize(self.mask)
         header['mask_frame_count'] = len(mask_frames)
         frames.extend(mask_frames)
         header['frame_count'] = len(frames)
@@ -152,8 +166,9 @@ class Column(object):
         data = Buffer(cudautils.ones(len(self), dtype=np.bool_))
         mask = NumericalColumn(data=data, mask=None, null_count=0,
                                dtype=np.bool_)
-        if self._mask is not None:
-            mask = mask.set_mask(self._mask).fillna(False)
+        if self.has_null_mask:
+            mask = mask.set_mask(self.mask,
+                                 null_count=self.null_count).fillna(False)
         return mask
 
     def __sizeof__(self):
@@ -179,17 +194,24 @@ class Column(object):
     def mask(self):
         """Validity mask buffer
         """
+        if self._null_count is None:
+            self._count_nulls()
         return self._mask
 
     @property
     def cffi_view(self):
         """LibGDF CFFI view
+
+        Built on first access and reused afterwards; the column is
+        immutable so the view never goes stale.
         """
-        return _gdf.columnview(size=self._data.size,
-                               data=self._data,
-                               mask=self._mask,
-                               dtype=self.dtype,
-                               null_count=self._null_count)
+        if self._cffi_view is None:
+            self._cffi_view = _gdf.columnview(size=self._data.size,
+                                              data=self._data,
+                                              mask=self.mask,
+                                              dtype=self.dtype,
+                                              null_count=self.null_count)
+        return self._cffi_view
 
     def set_mask(self, mask, null_count=None):
         """Create new Column by setting the mask
@@ -209,11 +231,17 @@ class Column(object):
             If None, it is calculated automatically.
 
         """
+        host_mask = mask if isinstance(mask, np.ndarray) else None
         if not isinstance(mask, Buffer):
             mask = Buffer(mask)
         if mask.dtype not in (np.dtype(np.uint8), np.dtype(np.int8)):
             msg = 'mask must be of byte; but got {}'.format(mask.dtype)
             raise ValueError(msg)
+        if (null_count is None and host_mask is not None
+                and host_mask.size * utils.mask_bitsize >= len(self)):
+            # Count on the host rather than with a kernel after the upload
+            nnz = utils.host_popcount(host_mask, len(self))
+            null_count = len(self) - nnz
         return self.replace(mask=mask, null_count=null_count)
 
     def allocate_mask(self, all_valid=True):
@@ -223,7 +251,7 @@ class Column(object):
         """
         nelem = len(self)
         mask_sz = utils.calc_chunk_size(nelem, utils.mask_bitsize)
-        mask = cuda.device_array(mask_sz, dtype=utils.mask_dtype)
+        mask = cudautils.device_array(mask_sz, dtype=utils.mask_dtype)
         cudautils.fill_value(mask, 0xff if all_valid else 0)
         return self.set_mask(mask=mask, null_count=0 if all_valid else nelem)
 
@@ -264,17 +292,19 @@ class Column(object):
     @property
     def valid_count(self):
         """Number of non-null values"""
-        return len(self) - self._null_count
+        return len(self) - self.null_count
 
     @property
     def null_count(self):
         """Number of null values"""
+        if self._null_count is None:
+            self._count_nulls()
         return self._null_count
 
     @property
     def has_null_mask(self):
         """A boolean indicating whether a null-mask is needed"""
-        return self._mask is not None
+        return self.mask is not None
 
     @property
     def nullmask(self):
@@ -286,10 +316,11 @@ class Column(object):
             raise ValueError('Column has no null mask')
 
     def _replace_defaults(self):
+        # Pass a deferred null count along instead of forcing it
         params = {
-            'data': self.data,
-            'mask': self.mask,
-            'null_count': self.null_count,
+            'data': self._data,
+            'mask': self._mask,
+            'null_count': self._null_count,
         }
         return params
 
@@ -350,17 +381,51 @@ class Column(object):
         ``IndexError`` if out-of-bound
         """
         val = self.data[index]  # this can raise IndexError
-        valid = (cudautils.mask_get.py_func(self.nullmask, index)
-                 if self.has_null_mask else True)
+        if self.has_null_mask:
+            index = utils.normalize_index(index, len(self))
+            hostmask = self.mask.to_array_cached()
+            valid = utils.mask_get.py_func(hostmask, index)
+        else:
+            valid = True
         return val if valid else None
 
+    def element_values(self, nrows=None):
+        """Bulk version of ``element_indexing`` for the first *nrows*
+        elements.
+
+        The data and the mask are copied to the host once.  Returns a list
+        with ``None`` in place of null values.
+        """
+        size = len(self) if nrows is None else min(nrows, len(self))
+        values = self.data[:size].to_array().view(self.data.dtype)
+        if not self.has_null_mask:
+            return list(values)
+        hostmask = self.mask.to_array_cached()
+        valid = utils.host_expand_mask_bits(size, hostmask)
+        return [v if ok else None for v, ok in zip(values, valid)]
+
+    def element_strings(self, nrows=None):
+        """String form of the first *nrows* elements with ``''`` for nulls.
+
+        The host values are formatted with a single ``astype(str)``.
+        """
+        size = len(self) if nrows is None else min(nrows, len(self))
+        values = self.data[:size].to_array().view(self.data.dtype)
+        out = values.astype(str).tolist()
+        if self.has_null_mask:
+            hostmask = self.mask.to_array_cached()
+            valid = utils.host_expand_mask_bits(size, hostmask)
+            for i in np.flatnonzero(~valid):
+                out[i] = ''
+        return out
+
     def __getitem__(self, arg):
         if isinstance(arg, Number):
             arg = int(arg)
             return self.element_indexing(arg)
         elif isinstance(arg, slice):
             # compute mask slice
-            start, stop = utils.normalize_slice(arg, len(self))
+            start, stop, _ = arg.indices(len(self))
             if self.null_count > 0:
                 if arg.step is not None and arg.step != 1:
                     raise NotImplementedError(arg)
@@ -368,11 +433,13 @@ class Column(object):
                 # slicing data
                 subdata = self.data[arg]
                 # slicing mask
+                # only the bits up to *stop* are needed
                 bytemask = cudautils.expand_mask_bits(
-                    self.data.size,
+                    stop,
                     self.mask.to_gpu_array(),
                     )
-                submask = Buffer(cudautils.compact_mask_bytes(bytemask[arg]))
+                submask = Buffer(
+                    cudautils.compact_mask_bytes(bytemask[start:stop]))
                 col = self.replace(data=subdata, mask=submask)
                 return col
             else:
@@ -414,7 +481,7 @@ class Column(object):
             if fillna == 'pandas':
                 na_value = self.default_na_value()
                 # fill nan
-                return self.fillna(na_value)
+                return self.fillna(na_value).data
             else:
                 return self._copy_to_dense_buffer()
         else:
@@ -455,7 +522,7 @@ class Column(object):
                                       "yet supported")
         newsize = len(self) + len(other)
         # allocate memory
-        mem = cuda.device_array(shape=newsize, dtype=self.data.dtype)
+        mem = cudautils.device_array(shape=newsize, dtype=self.data.dtype)
         newbuf = Buffer.from_empty(mem)
         # copy into new memory
         for buf in [self.data, other.data]:
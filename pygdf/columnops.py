@@ -70,7 +70,7 @@ class TypedColumnBase(Column):
 def column_empty_like(column, dtype, masked):
     """Allocate a new column like the given *column*
     """
-    data = cuda.device_array(shape=len(column), dtype=dtype)
+    data = cudautils.device_array(shape=len(column), dtype=dtype)
     params = dict(data=Buffer(data))
     if masked:
         mask = utils.make_mask(data.size)
@@ -86,7 +86,7 @@ def column_empty_like_same_mask(column, dtype):
     dtype : np.dtype like
         The dtype of the data buffer.
     """
-    data = cuda.device_array(shape=len(column), dtype=dtype)
+    data = cudautils.device_array(shape=len(column), dtype=dtype)
     params = dict(data=Buffer(data))
     if column.has_null_mask:
         params.update(mask=column.nullmask)
@@ -153,7 +153,7 @@ def as_column(arbitrary):
         if arbitrary.dtype.kind == 'M':
             data = datetime.DatetimeColumn.from_numpy(arbitrary)
         else:
-            data = as_column(cuda.to_device(arbitrary))
+            data = as_column(cudautils.to_device(arbitrary))
 
     elif isinstance(arbitrary, pa.Array):
         if isinstance(arbitrary, pa.StringArray):
@@ -272,7 +272,7 @@ def column_applymap(udf, column, out_dtype):
     result : Buffer
     """
     core = njit(udf)
-    results = cuda.device_array(shape=len(column), dtype=out_dtype)
+    results = cudautils.device_array(shape=len(column), dtype=out_dtype)
     values = column.data.to_gpu_array()
     if column.mask:
         # For masked columns
@@ -1,12 +1,24 @@
 # Copyright (c) 2018, NVIDIA CORPORATION.
 
+import threading
+from contextlib import contextmanager
+
 import numpy as np
 
-from numba import cuda, int32, numpy_support
+from numba import cuda, float64, int32, int64, numpy_support, uint8, void
 from math import isnan
 
 from .utils import mask_bitsize, mask_get, mask_set, make_mask
 
+try:
+    import rmm
+except ImportError:
+    rmm = None
+
+# RMM's ``device_array``; None when rmm is missing or its Python API does
+# not provide it, in which case numba's allocator is used.
+_rmm_device_array = getattr(rmm, 'device_array', None)
+
 
 def optimal_block_count(minblkct):
     """Return the optimal block count for a CUDA kernel launch.
@@ -14,11 +26,303 @@ def optimal_block_count(minblkct):
     return min(16, max(1, minblkct))
 
 
+# Launch configuration shared by the grid-stride reduction kernels
+# (``popcount_mask``, ``compute_minmax_device`` and ``compute_stats``).
+# REDUCE_BLKSZ must be a power of two.
+REDUCE_BLKSZ = 256
+REDUCE_ITEMS_PER_THREAD = 8
+# Resident reduction blocks per multiprocessor to aim for
+_REDUCE_BLOCKS_PER_SM = 4
+
+_max_reduce_blocks = []
+
+
+def reduction_block_count(size):
+    """Return the block count for reducing *size* items.
+
+    That is enough blocks to fill the device, but no more than needed to
+    give each thread about ``REDUCE_ITEMS_PER_THREAD`` items.
+    """
+    if not _max_reduce_blocks:
+        smct = cuda.get_current_device().MULTIPROCESSOR_COUNT
+        _max_reduce_blocks.append(smct * _REDUCE_BLOCKS_PER_SM)
+    per_block = REDUCE_BLKSZ * REDUCE_ITEMS_PER_THREAD
+    needed = (size + per_block - 1) // per_block
+    return max(1, min(_max_reduce_blocks[0], needed))
+
+
+# Device memory allocation
+
+def use_rmm_pool():
+    """Switch the RMM allocator to its memory pool.
+
+    Device arrays are allocated through RMM whenever it is installed.  With
+    the pool enabled, allocations are served from a preallocated pool
+    instead of a synchronizing ``cudaMalloc``/``cudaFree`` per call.
+    """
+    if _rmm_device_array is None:
+        raise ImportError("RMM is not available")
+    rmm.reinitialize(pool_allocator=True)
+
+
+def device_array(shape, dtype=np.float64, order='C'):
+    """Allocate an uninitialized device array.
+    Uses RMM if available; otherwise, the default numba allocator.
+    """
+    if _rmm_device_array is not None:
+        return _rmm_device_array(shape, dtype=dtype, order=order)
+    return cuda.device_array(shape, dtype=dtype, order=order)
+
+
+def device_array_like(ary):
+    """Allocate an uninitialized device array like *ary*.
+    """
+    order = 'F' if ary.is_f_contiguous() and ary.ndim > 1 else 'C'
+    return device_array(ary.shape, dtype=ary.dtype, order=order)
+
+
 def to_device(ary):
+    if cuda.devicearray.is_cuda_ndarray(ary):
+        # Already on the device; skip the generic conversion
+        return ary
+    if isinstance(ary, np.ndarray):
+        return copy_to_device(ary)
     dary, _ = cuda._auto_device(ary)
     return dary
 
 
+# Host transfer
+
+# Larger 1D transfers are split into tiles of this size.
+TRANSFER_TILE_SIZE = 8 * 1024 * 1024
+# Pinned staging buffers are only used for transfers up to this size, which
+# is also the size of the double-buffered tiles; larger 1D transfers are
+# tiled and larger matrices are copied from pageable memory.
+MAX_PINNED_STAGING_SIZE = 2 * TRANSFER_TILE_SIZE
+# Idle staging buffers kept for reuse, up to this many bytes in total.  It
+# holds a buffer of every size class with room to spare, so that releasing
+# a small buffer does not evict the largest one.
+MAX_PINNED_STAGING_POOL = 4 * MAX_PINNED_STAGING_SIZE
+
+# Idle staging buffers, least recently released first
+_pinned_staging_pool = []
+_pinned_staging_lock = threading.Lock()
+
+# Streams shared round-robin by the copies of ``copy_all_to_*``
+TRANSFER_STREAM_COUNT = 4
+
+_stream_pool = []
+
+
+def _get_streams(count):
+    """Get *count* streams from a pool that is created on first use.
+    """
+    while len(_stream_pool) < count:
+        _stream_pool.append(cuda.stream())
+    return _stream_pool[:count]
+
+
+@contextmanager
+def _pinned_staging(nbytes):
+    """Check out a pinned host buffer of at least *nbytes* for the duration
+    of the ``with`` block.
+
+    The buffer is private to the caller until the block exits, then it goes
+    back to a pool capped at ``MAX_PINNED_STAGING_POOL`` bytes, evicting the
+    least recently used buffers.  Sizes are rounded up to a power of two to
+    limit the number of distinct buffers.
+    """
+    size = 1 << max(0, nbytes - 1).bit_length()
+    buf = None
+    with _pinned_staging_lock:
+        for i in range(len(_pinned_staging_pool) - 1, -1, -1):
+            if _pinned_staging_pool[i].size == size:
+                buf = _pinned_staging_pool.pop(i)
+                break
+    if buf is None:
+        buf = cuda.pinned_array(size, dtype=np.byte)
+    try:
+        yield buf
+    finally:
+        with _pinned_staging_lock:
+            _pinned_staging_pool.append(buf)
+            pooled = sum(b.size for b in _pinned_staging_pool)
+            while pooled > MAX_PINNED_STAGING_POOL:
+                pooled -= _pinned_staging_pool.pop(0).size
+
+
+def copy_to_host(devary):
+    """Copy *devary* into a new host array.
+
+    The transfer goes through a reusable pinned staging buffer so that it is
+    done by DMA instead of going through pageable memory.
+    """
+    nbytes = devary.size * devary.dtype.itemsize
+    contiguous = devary.is_c_contiguous() or devary.is_f_contiguous()
+    if nbytes == 0 or not contiguous:
+        return devary.copy_to_host()
+    if devary.ndim == 1 and nbytes > MAX_PINNED_STAGING_SIZE:
+        out = np.empty(devary.size, dtype=devary.dtype)
+        _copy_to_host_tiled(devary, out)
+        return out
+    if nbytes > MAX_PINNED_STAGING_SIZE:
+        return devary.copy_to_host()
+    order = 'C' if devary.is_c_contiguous() else 'F'
+    with _pinned_staging(nbytes) as buf:
+        staging = buf[:nbytes].view(devary.dtype)
+        staging = staging.reshape(devary.shape, order=order)
+        devary.copy_to_host(staging)
+        return staging.copy(order='K')
+
+
+def _copy_to_host_tiled(devary, out):
+    """Download the 1D device array *devary* into the host array *out* by
+    tiles.
+
+    Two pinned tiles are used in turn, each with its own stream, so that
+    unpacking one tile on the host overlaps with the download of the other.
+    """
+    itemsize = devary.dtype.itemsize
+    tilelen = max(1, TRANSFER_TILE_SIZE // itemsize)
+    tilebytes = tilelen * itemsize
+    with _pinned_staging(2 * tilebytes) as staging:
+        tiles = [staging[:tilebytes].view(devary.dtype),
+                 staging[tilebytes:2 * tilebytes].view(devary.dtype)]
+        streams = _get_streams(2)
+        pending = [None, None]
+
+        def unpack(slot):
+            start, stop = pending[slot]
+            streams[slot].synchronize()
+            out[start:stop] = tiles[slot][:stop - start]
+            pending[slot] = None
+
+        for k, start in enumerate(range(0, devary.size, tilelen)):
+            stop = min(start + tilelen, devary.size)
+            slot = k % 2
+            if pending[slot] is not None:
+                unpack(slot)
+            devary[start:stop].copy_to_host(tiles[slot][:stop - start],
+                                            stream=streams[slot])
+            pending[slot] = start, stop
+        for slot in (0, 1):
+            if pending[slot] is not None:
+                unpack(slot)
+
+
+def copy_to_device(ary):
+    """Copy the host array *ary* into a new device array.
+
+    The data is packed into a reusable pinned staging buffer so that the
+    upload is done by DMA instead of going through pageable memory.
+    """
+    nbytes = ary.size * ary.dtype.itemsize
+    contiguous = ary.flags.c_contiguous or ary.flags.f_contiguous
+    if nbytes == 0 or not contiguous or ary.dtype.hasobject:
+        return cuda.to_device(ary)
+    if ary.ndim == 1 and nbytes > MAX_PINNED_STAGING_SIZE:
+        out = device_array(ary.size, dtype=ary.dtype)
+        _copy_to_device_tiled(ary, out)
+        return out
+    if nbytes > MAX_PINNED_STAGING_SIZE:
+        return cuda.to_device(ary)
+    order = 'C' if ary.flags.c_contiguous else 'F'
+    out = device_array(ary.shape, dtype=ary.dtype, order=order)
+    with _pinned_staging(nbytes) as buf:
+        staging = buf[:nbytes].view(ary.dtype)
+        staging = staging.reshape(ary.shape, order=order)
+        staging[...] = ary
+        out.copy_to_device(staging)
+    return out
+
+
+def _copy_to_device_tiled(ary, out):
+    """Upload the 1D host array *ary* into the device array *out* by tiles.
+
+    Two pinned tiles are used in turn, each with its own stream, so that
+    packing one tile on the host overlaps with the upload of the other.
+    """
+    itemsize = ary.dtype.itemsize
+    tilelen = max(1, TRANSFER_TILE_SIZE // itemsize)
+    tilebytes = tilelen * itemsize
+    with _pinned_staging(2 * tilebytes) as staging:
+        tiles = [staging[:tilebytes].view(ary.dtype),
+                 staging[tilebytes:2 * tilebytes].view(ary.dtype)]
+        streams = _get_streams(2)
+        for k, start in enumerate(range(0, ary.size, tilelen)):
+            stop = min(start + tilelen, ary.size)
+            tile = tiles[k % 2][:stop - start]
+            stream = streams[k % 2]
+            # The tile is free again once its previous upload is done
+            stream.synchronize()
+            tile[:] = ary[start:stop]
+            out[start:stop].copy_to_device(tile, stream=stream)
+        for stream in streams:
+            stream.synchronize()
+
+
+def copy_all_to_host(devarys):
+    """Copy each of the 1D device arrays in *devarys* into a new host array.
+
+    The copies are issued asynchronously on a few pooled streams into slices
+    of one pinned staging buffer so that they can overlap.  There is a single
+    synchronization after all copies are issued.
+    """
+    align = 256
+    nbytes = [ary.size * ary.dtype.itemsize for ary in devarys]
+    padded = [(n + align - 1) // align * align for n in nbytes]
+    total = sum(padded)
+    contiguous = all(ary.is_c_contiguous() for ary in devarys)
+    if total == 0 or total > MAX_PINNED_STAGING_SIZE or not contiguous:
+        return [copy_to_host(ary) for ary in devarys]
+
+    streams = _get_streams(min(TRANSFER_STREAM_COUNT, len(devarys)))
+    with _pinned_staging(total) as staging:
+        views = []
+        offset = 0
+        for k, (ary, n, padn) in enumerate(zip(devarys, nbytes, padded)):
+            view = staging[offset:offset + n].view(ary.dtype)
+            if n > 0:
+                ary.copy_to_host(view, stream=streams[k % len(streams)])
+            views.append(view)
+            offset += padn
+        for stream in streams:
+            stream.synchronize()
+        return [view.copy() for view in views]
+
+
+def copy_all_to_device(arys):
+    """Copy each of the 1D host arrays in *arys* into a new device array.
+
+    The host data is packed into one pinned staging buffer and the copies
+    are issued asynchronously on a few pooled streams so that they can
+    overlap.  There is a single synchronization after all copies are issued.
+    """
+    align = 256
+    arys = [np.ascontiguousarray(ary) for ary in arys]
+    nbytes = [ary.size * ary.dtype.itemsize for ary in arys]
+    padded = [(n + align - 1) // align * align for n in nbytes]
+    total = sum(padded)
+    if total == 0 or total > MAX_PINNED_STAGING_SIZE:
+        return [to_device(ary) for ary in arys]
+
+    outs = []
+    streams = _get_streams(min(TRANSFER_STREAM_COUNT, len(arys)))
+    with _pinned_staging(total) as staging:
+        offset = 0
+        for k, (ary, n, padn) in enumerate(zip(arys, nbytes, padded)):
+            out = device_array(ary.shape, dtype=ary.dtype)
+            if n > 0:
+                view = staging[offset:offset + n].view(ary.dtype)
+                view[:] = ary
+                out.copy_to_device(view, stream=streams[k % len(streams)])
+            outs.append(out)
+            offset += padn
+        for stream in streams:
+            stream.synchronize()
+    return outs
+
+
 # GPU array initializer
 
 @cuda.jit
@@ -36,7 +340,7 @@ def arange(start, stop=None, step=1, dtype=np.int64):
         msgfmt = "size={size} in arange({start}, {stop}, {step}, {dtype})"
         raise ValueError(msgfmt.format(size=size, start=start, stop=stop,
                                        step=step, dtype=dtype))
-    out = cuda.device_array(size, dtype=dtype)
+    out = device_array(size, dtype=dtype)
     gpu_arange.forall(size)(start, size, step, out)
     return out
 
@@ -49,7 +353,7 @@ def gpu_arange_reversed(size, out):
 
 
 def arange_reversed(size, dtype=np.int64):
-    out = cuda.device_array(size, dtype=dtype)
+    out = device_array(size, dtype=dtype)
     gpu_arange_reversed.forall(size)(size, out)
     return out
 
@@ -62,7 +366,7 @@ def gpu_ones(size, out):
 
 
 def ones(size, dtype):
-    out = cuda.device_array(size, dtype=dtype)
+    out = device_array(size, dtype=dtype)
     gpu_ones.forall(size)(size, out)
     return out
 
@@ -75,7 +379,7 @@ def gpu_zeros(size, out):
 
 
 def zeros(size, dtype):
-    out = cuda.device_array(size, dtype=dtype)
+    out = device_array(size, dtype=dtype)
     gpu_zeros.forall(size)(size, out)
     return out
 
@@ -94,9 +398,9 @@ def astype(ary, dtype):
     if ary.dtype == np.dtype(dtype):
         return ary
     elif ary.size == 0:
-        return cuda.device_array(shape=ary.shape, dtype=dtype)
+        return device_array(shape=ary.shape, dtype=dtype)
     else:
-        out = cuda.device_array(shape=ary.shape, dtype=dtype)
+        out = device_array(shape=ary.shape, dtype=dtype)
         configured = gpu_copy.forall(out.size)
         configured(ary, out)
         return out
@@ -104,7 +408,7 @@ def astype(ary, dtype):
 
 def copy_array(arr, out=None):
     if out is None:
-        out = cuda.device_array_like(arr)
+        out = device_array_like(arr)
     assert out.size == arr.size
     if arr.is_c_contiguous() and out.is_c_contiguous():
         out.copy_to_device(arr)
@@ -115,7 +419,7 @@ def copy_array(arr, out=None):
 
 def as_contiguous(arr):
     assert arr.ndim == 1
-    out = cuda.device_array(shape=arr.shape, dtype=arr.dtype)
+    out = device_array(shape=arr.shape, dtype=arr.dtype)
     return copy_array(arr, out=out)
 
 
@@ -150,9 +454,14 @@ def gpu_set_mask_from_stride(mask, stride):
         mask[tid] = val
 
 
-def set_mask_from_stride(mask, stride):
+def set_mask_from_stride(mask, stride, stream=0):
+    """Set every *stride*-th bit of *mask*, clearing the others.
+
+    The kernel is launched on *stream* without synchronizing, so that
+    later work on the same stream can use the mask right away.
+    """
     taskct = mask.size
-    configured = gpu_set_mask_from_stride.forall(taskct)
+    configured = gpu_set_mask_from_stride.forall(taskct, stream=stream)
     configured(mask, stride)
 
 
@@ -187,10 +496,16 @@ def gpu_expand_mask_bits(bits, out):
         out[i] = mask_get(bits, i)
 
 
-def expand_mask_bits(size, bits):
+def expand_mask_bits(size, bits, out=None):
     """Expand bit-mask into byte-mask
+
+    The output array can be specified in `out`.
     """
-    expanded_mask = cuda.device_array(size, dtype=np.int32)
+    if out is None:
+        expanded_mask = device_array(size, dtype=np.int32)
+    else:
+        assert out.size == size
+        expanded_mask = out
     numtasks = min(1024, expanded_mask.size)
     if numtasks > 0:
         gpu_expand_mask_bits.forall(numtasks)(bits, expanded_mask)
@@ -200,7 +515,7 @@ def expand_mask_bits(size, bits):
 def mask_assign_slot(size, mask):
     # expand bits into bytes
     dtype = (np.int32 if size < 2 ** 31 else np.int64)
-    expanded_mask = cuda.device_array(size, dtype=dtype)
+    expanded_mask = device_array(size, dtype=dtype)
     numtasks = min(64 * 128, expanded_mask.size)
     if numtasks > 0:
         gpu_expand_mask_bits.forall(numtasks)(mask, expanded_mask)
@@ -220,8 +535,7 @@ def prefixsum(vals):
     from . import _gdf
 
     # Allocate output
-    slots = cuda.device_array(shape=vals.size + 1,
-                              dtype=vals.dtype)
+    slots = device_array(shape=vals.size + 1, dtype=vals.dtype)
     # Fill 0 to slot[0]
     gpu_fill_value[1, 1](slots[:1], 0)
 
@@ -247,7 +561,7 @@ def copy_to_dense(data, mask, out=None):
         # output buffer is not provided
         # allocate one
         alloc_shape = sz
-        out = cuda.device_array(shape=alloc_shape, dtype=data.dtype)
+        out = device_array(shape=alloc_shape, dtype=data.dtype)
     else:
         # output buffer is provided
         # check it
@@ -298,6 +612,56 @@ def mask_from_devary(ary):
         gpu_mask_from_devary.forall(bits.size)(ary, bits)
     return bits
 
+
+@cuda.jit
+def gpu_popcount_mask(words, tail, lastbyte, out):
+    tid = cuda.grid(1)
+    step = cuda.gridsize(1)
+    acc = 0
+    for i in range(tid, words.size, step):
+        acc += int64(cuda.popc(words[i]))
+    for i in range(tid, tail.size, step):
+        byte = tail[i]
+        if i == tail.size - 1:
+            byte &= lastbyte
+        acc += int64(cuda.popc(byte))
+    # Reduce within the block, then one atomic per block
+    partials = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=int64)
+    tx = cuda.threadIdx.x
+    partials[tx] = acc
+    cuda.syncthreads()
+    width = cuda.blockDim.x // 2
+    while width > 0:
+        if tx < width:
+            partials[tx] += partials[tx + width]
+        cuda.syncthreads()
+        width //= 2
+    if tx == 0:
+        cuda.atomic.add(out, 0, partials[0])
+
+
+def popcount_mask(mask, size):
+    """Count the valid (set) bits among the first *size* bits of *mask*.
+
+    Whole 64-bit words are counted with one ``popc`` each; the remaining
+    bytes, with the bits past *size* cleared, are counted separately.
+    """
+    nbytes = (size + mask_bitsize - 1) // mask_bitsize
+    if nbytes == 0:
+        return 0
+    # Keep at least one byte in the tail so the last byte can be trimmed
+    nwords = (nbytes - 1) // 8
+    if mask.device_ctypes_pointer.value % 8:
+        nwords = 0
+    words = mask[:nwords * 8].view(np.uint64)
+    tail = mask[nwords * 8:nbytes]
+    rem = size % mask_bitsize
+    lastbyte = (1 << rem) - 1 if rem else 0xff
+    out = zeros(1, dtype=np.int64)
+    blkct = reduction_block_count(max(nwords, tail.size))
+    gpu_popcount_mask[blkct, REDUCE_BLKSZ](words, tail, lastbyte, out)
+    return int(out.copy_to_host()[0])
+
 #
 # Gather
 #
@@ -317,7 +681,7 @@ def gather(data, index, out=None):
     """Perform ``out = data[index]`` on the GPU
     """
     if out is None:
-        out = cuda.device_array(shape=index.size, dtype=data.dtype)
+        out = device_array(shape=index.size, dtype=data.dtype)
     gpu_gather.forall(index.size)(data, index, out)
     return out
 
@@ -339,7 +703,7 @@ def gpu_gather_joined_index(lkeys, rkeys, lidx, ridx, out):
 
 def gather_joined_index(lkeys, rkeys, lidx, ridx):
     assert lidx.size == ridx.size
-    out = cuda.device_array(lidx.size, dtype=lkeys.dtype)
+    out = device_array(lidx.size, dtype=lkeys.dtype)
     gpu_gather_joined_index.forall(lidx.size)(lkeys, rkeys, lidx, ridx, out)
     return out
 
@@ -356,19 +720,22 @@ def reverse_array(data, out=None):
 
 
 @cuda.jit
-def gpu_fill_masked(value, validity, out):
+def gpu_copy_fill_masked(data, validity, value, out):
     tid = cuda.grid(1)
     if tid < out.size:
-        valid = mask_get(validity, tid)
-        if not valid:
+        if mask_get(validity, tid):
+            out[tid] = data[tid]
+        else:
             out[tid] = value
 
 
 def fillna(data, mask, value):
-    out = cuda.device_array_like(data)
-    out.copy_to_device(data)
-    configured = gpu_fill_masked.forall(data.size)
-    configured(value, mask, out)
+    """Copy *data* into a new array with null values replaced by *value*.
+    The copy and the fill are done in a single pass.
+    """
+    out = device_array_like(data)
+    configured = gpu_copy_fill_masked.forall(data.size)
+    configured(data, mask, value, out)
     return out
 
 
@@ -409,7 +776,7 @@ def apply_equal_constant(arr, mask, val, dtype):
     -------
     result : device array
     """
-    out = cuda.device_array(shape=arr.size, dtype=dtype)
+    out = device_array(shape=arr.size, dtype=dtype)
     if mask is not None:
         configured = gpu_equal_constant_masked.forall(out.size)
         configured(arr, mask, val, out)
@@ -420,17 +787,102 @@ def apply_equal_constant(arr, mask, val, dtype):
 
 
 @cuda.jit
-def gpu_scale(arr, vmin, vmax, out):
+def gpu_one_hot_encode(arr, cats, out):
     i = cuda.grid(1)
-    if i < out.size:
+    if i < arr.size:
         val = arr[i]
-        out[i] = (val - vmin) / (vmax - vmin)
+        for j in range(cats.size):
+            out[j, i] = (val == cats[j])
+
+
+def apply_one_hot_encoding(arr, cats, dtype):
+    """Compute ``arr == cats[j]`` for every category in a single pass.
 
+    Parameters
+    ----------
+    arr : device array
+        data
+    cats : device array
+        category values
+    dtype : np.dtype
+        output array dtype
+
+    Returns
+    -------
+    result : device array
+        A (len(cats), arr.size) matrix.  Row *j* holds the encoding of
+        ``cats[j]``.
+    """
+    out = device_array(shape=(cats.size, arr.size), dtype=dtype)
+    if out.size > 0:
+        gpu_one_hot_encode.forall(arr.size)(arr, cats, out)
+    return out
+
+
+@cuda.jit
+def gpu_minmax_partials(mins, maxs, out_min, out_max):
+    tid = cuda.grid(1)
+    if tid < out_min.size:
+        vmin = mins[tid]
+        vmax = maxs[tid]
+        step = cuda.gridsize(1)
+        for i in range(tid + step, mins.size, step):
+            vmin = min(vmin, mins[i])
+            vmax = max(vmax, maxs[i])
+        out_min[tid] = vmin
+        out_max[tid] = vmax
+
+
+def _minmax_partials(arr):
+    """Reduce the non-empty device array *arr* to device arrays of partial
+    minimums and maximums holding at most one block's worth of items.
+
+    Each thread reduces a grid-stride slice; the partials are reduced
+    again the same way until they are small enough.
+    """
+    vmins = vmaxs = arr
+    per_block = REDUCE_BLKSZ * REDUCE_ITEMS_PER_THREAD
+    while True:
+        blkct = reduction_block_count(vmins.size)
+        nparts = min(blkct * REDUCE_BLKSZ, vmins.size)
+        out_min = device_array(nparts, dtype=arr.dtype)
+        out_max = device_array(nparts, dtype=arr.dtype)
+        configured = gpu_minmax_partials[blkct, REDUCE_BLKSZ]
+        configured(vmins, vmaxs, out_min, out_max)
+        shrunk = nparts < vmins.size
+        vmins, vmaxs = out_min, out_max
+        if nparts <= per_block or not shrunk:
+            return vmins, vmaxs
+
+
+def compute_minmax_device(arr):
+    """Compute the min and max of the non-empty device array *arr* in a
+    single pass.  They are returned as 1-element device arrays, so that no
+    copy to the host is needed.
+    """
+    vmins, vmaxs = _minmax_partials(arr)
+    d_vmin = device_array(1, dtype=arr.dtype)
+    d_vmax = device_array(1, dtype=arr.dtype)
+    # A single thread combines the last few partials
+    gpu_minmax_partials[1, 1](vmins, vmaxs, d_vmin, d_vmax)
+    return d_vmin, d_vmax
+
+
+@cuda.jit
+def gpu_scale(arr, d_vmin, d_vmax, out):
+    i = cuda.grid(1)
+    if i < out.size:
+        vmin = d_vmin[0]
+        vmax = d_vmax[0]
+        out[i] = (arr[i] - vmin) / (vmax - vmin)
 
-def compute_scale(arr, vmin, vmax):
-    out = cuda.device_array(shape=arr.size, dtype=np.float64)
-    configured = gpu_scale.forall(out.size)
-    configured(arr, vmin, vmax, out)
+
+def compute_scale(arr, d_vmin, d_vmax):
+    """Scale *arr* to [0, 1] given its min and max as the 1-element device
+    arrays *d_vmin* and *d_vmax* of ``compute_minmax_device``.
+    """
+    out = device_array(shape=arr.size, dtype=np.float64)
+    gpu_scale.forall(out.size)(arr, d_vmin, d_vmax, out)
     return out
 
 
@@ -465,11 +917,239 @@ def apply_label(arr, cats, dtype, na_sentinel):
     """
     encs = np.asarray(list(range(cats.size)))
     d_encs = to_device(encs)
-    out = cuda.device_array(shape=arr.size, dtype=dtype)
+    out = device_array(shape=arr.size, dtype=dtype)
     configured = gpu_label.forall(out.size)
     configured(arr, cats, d_encs, na_sentinel, out)
     return out
 
+
+#
+# Statistics
+#
+
+@cuda.jit(device=True)
+def gpu_welford_block_merge(sn, smean, sm2):
+    """Merge the per-thread Welford states held in the shared arrays into
+    slot 0.  The caller must sync the block before calling.
+    """
+    tx = cuda.threadIdx.x
+    width = cuda.blockDim.x // 2
+    while width > 0:
+        if tx < width and sn[tx + width] > 0:
+            na = sn[tx]
+            nb = sn[tx + width]
+            nab = na + nb
+            delta = smean[tx + width] - smean[tx]
+            smean[tx] += delta * nb / nab
+            sm2[tx] += sm2[tx + width] + delta * delta * na * nb / nab
+            sn[tx] = nab
+        cuda.syncthreads()
+        width //= 2
+
+
+@cuda.jit
+def gpu_welford_combine(in_n, in_mean, in_m2, out):
+    """Combine row ``j`` of the (nseries x nblocks) block partials into
+    ``out[j] = (n, mean, m2)``.
+
+    Run with one block of REDUCE_BLKSZ threads per row.
+    """
+    tx = cuda.threadIdx.x
+    j = cuda.blockIdx.x
+    n = 0.
+    avg = 0.
+    m2 = 0.
+    for i in range(tx, in_n.shape[1], cuda.blockDim.x):
+        nb = in_n[j, i]
+        if nb > 0:
+            nab = n + nb
+            delta = in_mean[j, i] - avg
+            avg += delta * nb / nab
+            m2 += in_m2[j, i] + delta * delta * n * nb / nab
+            n = nab
+    sn = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+    smean = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+    sm2 = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+    sn[tx] = n
+    smean[tx] = avg
+    sm2[tx] = m2
+    cuda.syncthreads()
+    gpu_welford_block_merge(sn, smean, sm2)
+    if tx == 0:
+        out[j, 0] = sn[0]
+        out[j, 1] = smean[0]
+        out[j, 2] = sm2[0]
+
+
+# Welford kernels by (dtype, has_mask); see ``_get_welford_kernel``
+_welford_kernels = {}
+
+
+def _get_welford_kernel(dtype, has_mask):
+    """Return the block-partial Welford kernel for *dtype* data.
+
+    Kernels are compiled eagerly for the concrete signature and cached, so
+    that a launch skips the dispatcher's argument typing.  *has_mask* is
+    baked in as a constant to drop the validity check for unmasked data.
+    """
+    key = (dtype, has_mask)
+    try:
+        return _welford_kernels[key]
+    except KeyError:
+        pass
+    nbtype = numpy_support.from_dtype(dtype)
+    sig = void(nbtype[:], uint8[:], float64[:], float64[:], float64[:])
+
+    @cuda.jit(sig)
+    def gpu_welford_partials(data, mask, out_n, out_mean, out_m2):
+        tid = cuda.grid(1)
+        step = cuda.gridsize(1)
+        # Per-thread Welford update over a grid-stride loop
+        n = 0.
+        avg = 0.
+        m2 = 0.
+        for i in range(tid, data.size, step):
+            if has_mask and not mask_get(mask, i):
+                continue
+            # Accumulate in float64; a float32 M2 loses the variance
+            # once the mean is large relative to the spread
+            v = float64(data[i])
+            n += 1
+            delta = v - avg
+            avg += delta / n
+            m2 += delta * (v - avg)
+        # Merge the per-thread states within the block
+        sn = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+        smean = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+        sm2 = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+        tx = cuda.threadIdx.x
+        sn[tx] = n
+        smean[tx] = avg
+        sm2[tx] = m2
+        cuda.syncthreads()
+        gpu_welford_block_merge(sn, smean, sm2)
+        if tx == 0:
+            blk = cuda.blockIdx.x
+            out_n[blk] = sn[0]
+            out_mean[blk] = smean[0]
+            out_m2[blk] = sm2[0]
+
+    _welford_kernels[key] = gpu_welford_partials
+    return gpu_welford_partials
+
+
+def compute_stats(data, mask=None):
+    """Compute the count, mean and sum of squared deviations (M2) of the
+    valid values of *data* in a single pass.
+
+    Each thread runs Welford's update over its elements, accumulating in
+    float64 whatever the input dtype.  The states are
+    merged per block, then the block partials are merged by a second
+    single-block kernel, so only the final triple is copied back.
+
+    Parameters
+    ----------
+    data : device array
+    mask : device array; optional
+        The null-mask of *data*.
+
+    Returns
+    -------
+    (n, mean, m2) : (int, float, float)
+    """
+    has_mask = mask is not None
+    if not has_mask:
+        mask = device_array(0, dtype=np.uint8)
+    elif mask.dtype != np.uint8:
+        # The kernels are compiled for uint8 masks; int8 ones are accepted
+        # by ``Column.set_mask`` too
+        mask = mask.view(np.uint8)
+    blkct = reduction_block_count(data.size)
+    d_n = device_array(blkct, dtype=np.float64)
+    d_mean = device_array(blkct, dtype=np.float64)
+    d_m2 = device_array(blkct, dtype=np.float64)
+    kernel = _get_welford_kernel(data.dtype, has_mask)
+    kernel[blkct, REDUCE_BLKSZ](data, mask, d_n, d_mean, d_m2)
+    d_out = device_array((1, 3), dtype=np.float64)
+    gpu_welford_combine[1, REDUCE_BLKSZ](d_n.reshape(1, blkct),
+                                         d_mean.reshape(1, blkct),
+                                         d_m2.reshape(1, blkct), d_out)
+    n, avg, m2 = d_out.copy_to_host()[0]
+    return int(n), float(avg), float(m2)
+
+
+# Batched Welford kernels by dtype; see ``_get_welford_batched_kernel``
+_welford_batched_kernels = {}
+
+
+def _get_welford_batched_kernel(dtype):
+    """Return the block-partial Welford kernel over the columns of a
+    *dtype* matrix.  ``blockIdx.y`` selects the column.
+    """
+    try:
+        return _welford_batched_kernels[dtype]
+    except KeyError:
+        pass
+    nbtype = numpy_support.from_dtype(dtype)
+    sig = void(nbtype[:, :], float64[:, :], float64[:, :], float64[:, :])
+
+    @cuda.jit(sig)
+    def gpu_welford_batched_partials(matrix, out_n, out_mean, out_m2):
+        col = cuda.blockIdx.y
+        tid = cuda.blockIdx.x * cuda.blockDim.x + cuda.threadIdx.x
+        step = cuda.gridDim.x * cuda.blockDim.x
+        n = 0.
+        avg = 0.
+        m2 = 0.
+        for i in range(tid, matrix.shape[0], step):
+            v = float64(matrix[i, col])
+            n += 1
+            delta = v - avg
+            avg += delta / n
+            m2 += delta * (v - avg)
+        sn = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+        smean = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+        sm2 = cuda.shared.array(shape=REDUCE_BLKSZ, dtype=float64)
+        tx = cuda.threadIdx.x
+        sn[tx] = n
+        smean[tx] = avg
+        sm2[tx] = m2
+        cuda.syncthreads()
+        gpu_welford_block_merge(sn, smean, sm2)
+        if tx == 0:
+            blk = cuda.blockIdx.x
+            out_n[col, blk] = sn[0]
+            out_mean[col, blk] = smean[0]
+            out_m2[col, blk] = sm2[0]
+
+    _welford_batched_kernels[dtype] = gpu_welford_batched_partials
+    return gpu_welford_batched_partials
+
+
+def compute_stats_batched(matrix):
+    """Compute ``compute_stats`` for every column of the null-free
+    (nrow x ncol) device *matrix* at once.
+
+    All columns are reduced by one launch over a (blocks x ncol) grid and
+    combined by a second launch, with a single copy back to the host.
+
+    Returns
+    -------
+    A list of ``(n, mean, m2)``, one per column.
+    """
+    nrow, ncol = matrix.shape
+    blkct = reduction_block_count(nrow)
+    d_n = device_array((ncol, blkct), dtype=np.float64)
+    d_mean = device_array((ncol, blkct), dtype=np.float64)
+    d_m2 = device_array((ncol, blkct), dtype=np.float64)
+    kernel = _get_welford_batched_kernel(matrix.dtype)
+    kernel[(blkct, ncol), REDUCE_BLKSZ](matrix, d_n, d_mean, d_m2)
+    d_out = device_array((ncol, 3), dtype=np.float64)
+    gpu_welford_combine[ncol, REDUCE_BLKSZ](d_n, d_mean, d_m2, d_out)
+    return [(int(n), float(avg), float(m2))
+            for n, avg, m2 in d_out.copy_to_host()]
+
+
 #
 # Misc kernels
 #
@@ -578,8 +1258,8 @@ class UniqueK(object):
         if k >= MAX_FAST_UNIQUE_K:
             raise NotImplementedError('k >= {}'.format(MAX_FAST_UNIQUE_K))
         # setup mem
-        outsz_ptr = cuda.device_array(shape=1, dtype=np.intp)
-        out = cuda.device_array_like(arr)
+        outsz_ptr = device_array(shape=1, dtype=np.intp)
+        out = device_array_like(arr)
         # kernel
         self._kernel[1, 64](arr, k, out, outsz_ptr)
         # copy to host
@@ -652,7 +1332,7 @@ def find_segments(arr, segs=None, markers=None):
     ct = slots[slots.size - 1]
     scanned = slots[:-1]
     # Compact segments
-    begins = cuda.device_array(shape=int(ct), dtype=np.intp)
+    begins = device_array(shape=int(ct), dtype=np.intp)
     gpu_scatter_segment_begins.forall(markers.size)(markers, scanned, begins)
     return begins, markers
 
@@ -667,7 +1347,7 @@ def gpu_value_counts(arr, counts, total_size):
 
 
 def value_count(arr, total_size):
-    counts = cuda.device_array(shape=len(arr), dtype=np.intp)
+    counts = device_array(shape=len(arr), dtype=np.intp)
     gpu_value_counts.forall(arr.size)(arr, counts, total_size)
     return counts
 
@@ -686,7 +1366,7 @@ def recode(data, recode_table, na_value):
     """Recode data with the given recode table.
     And setting out-of-range values to *na_value*
     """
-    newdata = cuda.device_array_like(data)
+    newdata = device_array_like(data)
     recode_table = to_device(recode_table)
     blksz = 32 * 4
     blkct = min(16, max(1, data.size // blksz))
@@ -694,17 +1374,41 @@ def recode(data, recode_table, na_value):
     return newdata
 
 
+def column_matrix(cols, nrow, ncol, dtype):
+    """Stack the null-free columns *cols* into a column-major matrix.
+    Each column is a single contiguous device-to-device copy.
+    """
+    matrix = device_array(shape=(nrow, ncol), dtype=dtype, order='F')
+    for colidx, col in enumerate(cols):
+        matrix[:, colidx].copy_to_device(col.to_gpu_array())
+    return matrix
+
+
+# Columns passed to one ``gpu_row_matrix`` launch; bounded by the size of
+# the kernel parameters since each column is a separate array argument.
+ROW_MATRIX_COLUMNS_PER_LAUNCH = 32
+
+
 @cuda.jit
-def gpu_row_matrix(rowmatrix, col, nrow, ncol):
-    i = cuda.grid(1)
-    if i < rowmatrix.size:
-        rowmatrix[i] = col[i]
+def gpu_row_matrix(cols, matrix):
+    tid = cuda.grid(1)
+    ncol = len(cols)
+    if tid < matrix.shape[0] * ncol:
+        i = tid // ncol
+        j = tid % ncol
+        matrix[i, j] = cols[j][i]
 
 
 def row_matrix(cols, nrow, ncol, dtype):
-    matrix = cuda.device_array(shape=(nrow, ncol), dtype=dtype, order='C')
-    for colidx, col in enumerate(cols):
-        gpu_row_matrix.forall(matrix[:, colidx].size)(matrix[:, colidx],
-                                                      col.to_gpu_array(),
-                                                      nrow, ncol)
+    """Stack the null-free columns *cols* into a row-major matrix.
+
+    A single kernel fills the rows from a tuple of the column arrays, with
+    one launch per ``ROW_MATRIX_COLUMNS_PER_LAUNCH`` columns.
+    """
+    matrix = device_array(shape=(nrow, ncol), dtype=dtype, order='C')
+    step = ROW_MATRIX_COLUMNS_PER_LAUNCH
+    for start in range(0, ncol, step):
+        arrays = tuple(col.to_gpu_array() for col in cols[start:start + step])
+        out = matrix[:, start:start + len(arrays)]
+        gpu_row_matrix.forall(nrow * len(arrays))(arrays, out)
     return matrix
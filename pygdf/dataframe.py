@@ -11,10 +11,10 @@ import numpy as np
 import pandas as pd
 import pyarrow as pa
 
-from numba import cuda
 from numba.cuda.cudadrv.devicearray import DeviceNDArray
 
 from . import cudautils, formatting, queryutils, applyutils, utils, _gdf
+from . import numerical
 from .index import GenericIndex, Index, RangeIndex
 from .series import Series
 from .column import Column
@@ -90,6 +90,8 @@ class DataFrame(object):
         self._index = index
         self._size = len(index)
         self._cols = OrderedDict()
+        # Cached ``.columns``; reset whenever a column is added or dropped
+        self._columns = None
         # has initializer?
         if name_series is not None:
             if isinstance(name_series, dict):
@@ -256,9 +258,9 @@ class DataFrame(object):
             nrows = min(nrows, len(self))  # cap row count
 
         if ncols is None:
-            ncols = len(self.columns)
+            ncols = len(self._cols)
 
-        more_cols = len(self.columns) - ncols
+        more_cols = len(self._cols) - ncols
         more_rows = len(self) - nrows
 
         # Prepare cells
@@ -281,7 +283,7 @@ class DataFrame(object):
 
     def __repr__(self):
         return "<pygdf.DataFrame ncols={} nrows={} >".format(
-            len(self.columns),
+            len(self._cols),
             len(self),
         )
 
@@ -310,7 +312,9 @@ class DataFrame(object):
     def columns(self):
         """Returns a tuple of columns
         """
-        return pd.Index(self._cols)
+        if self._columns is None:
+            self._columns = pd.Index(self._cols)
+        return self._columns
 
     @property
     def index(self):
@@ -352,20 +356,19 @@ class DataFrame(object):
 
     def copy(self):
         "Shallow copy this dataframe"
-        df = DataFrame()
-        df._index = self._index
+        df = DataFrame(index=self._index)
         df._size = self._size
         df._cols = self._cols.copy()
+        df._columns = self._columns
         return df
 
-    def _sanitize_columns(self, col):
+    def _sanitize_columns(self, series):
         """Sanitize pre-appended
            col values
         """
-        series = Series(col)
-        if len(self) == 0 and len(self.columns) > 0 and len(series) > 0:
+        if len(self) == 0 and len(self._cols) > 0 and len(series) > 0:
             ind = series.index
-            arr = cuda.device_array(shape=len(ind), dtype=np.float64)
+            arr = cudautils.device_array(shape=len(ind), dtype=np.float64)
             size = utils.calc_chunk_size(arr.size, utils.mask_bitsize)
             mask = cudautils.zeros(size, dtype=utils.mask_dtype)
             val = Series.from_masked_array(arr, mask, null_count=len(ind))
@@ -374,22 +377,21 @@ class DataFrame(object):
             self._index = series.index
             self._size = len(series)
 
-    def _sanitize_values(self, col):
+    def _sanitize_values(self, col, series):
         """Sanitize col values before
            being added
         """
         index = self._index
-        series = Series(col)
         sind = series.index
         VALID = isinstance(col, (np.ndarray, DeviceNDArray, list, Series,
                                  Column))
         if len(self) > 0 and len(series) == 1 and not VALID:
-            arr = cuda.device_array(shape=len(index), dtype=series.dtype)
+            arr = cudautils.device_array(shape=len(index), dtype=series.dtype)
             cudautils.gpu_fill_value.forall(arr.size)(arr, col)
             return Series(arr)
         elif len(self) > 0 and len(sind) != len(index):
             raise ValueError('Length of values does not match index length')
-        return col
+        return series
 
     def _prepare_series_for_add(self, col, forceindex=False):
         """Prepare a series to be added to the DataFrame.
@@ -403,11 +405,12 @@ class DataFrame(object):
         -------
         The prepared Series object.
         """
-        self._sanitize_columns(col)
-        col = self._sanitize_values(col)
+        # Convert once; the sanitizers share the converted Series
+        series = Series(col)
+        self._sanitize_columns(series)
+        series = self._sanitize_values(col, series)
 
         empty_index = len(self._index) == 0
-        series = Series(col)
         if forceindex or empty_index or self._index == series.index:
             if empty_index:
                 self._index = series.index
@@ -433,6 +436,7 @@ class DataFrame(object):
         series = self._prepare_series_for_add(data, forceindex=forceindex)
         series.name = name
         self._cols[name] = series
+        self._columns = None
 
     def drop_column(self, name):
         """Drop a column by *name*
@@ -440,6 +444,7 @@ class DataFrame(object):
         if name not in self._cols:
             raise NameError('column {!r} does not exist'.format(name))
         del self._cols[name]
+        self._columns = None
 
     @classmethod
     def _concat(cls, objs, ignore_index=False):
@@ -486,18 +491,14 @@ class DataFrame(object):
         dtype = cols[0].dtype
         if any(dtype != c.dtype for c in cols):
             raise ValueError('all columns must have the same dtype')
-        for k, c in self._cols.items():
+        for k, c in zip(columns, cols):
             if c.null_count > 0:
                 errmsg = ("column {!r} has null values. "
                           "hint: use .fillna() to replace null values")
                 raise ValueError(errmsg.format(k))
 
         if order == 'F':
-            matrix = cuda.device_array(shape=(nrow, ncol), dtype=dtype,
-                                       order=order)
-            for colidx, inpcol in enumerate(cols):
-                dense = inpcol.to_gpu_array(fillna='pandas')
-                matrix[:, colidx].copy_to_device(dense)
+            matrix = cudautils.column_matrix(cols, nrow, ncol, dtype)
         elif order == 'C':
             matrix = cudautils.row_matrix(cols, nrow, ncol, dtype)
         else:
@@ -519,7 +520,38 @@ class DataFrame(object):
         -------
         A (nrow x ncol) numpy ndarray in "F" order.
         """
-        return self.as_gpu_matrix(columns=columns).copy_to_host()
+        return cudautils.copy_to_host(self.as_gpu_matrix(columns=columns))
+
+    def mean_var(self, columns=None, ddof=1):
+        """Compute the mean and variance of the numeric columns.
+
+        Short null-free columns of the same dtype are reduced together, and
+        the results are cached on the columns for later ``Series.mean_var``.
+
+        Parameters
+        ----------
+        columns : sequence of str
+            List of a column names to use.  If None is specified, all
+            numeric columns are used.
+        ddof : int
+            Delta degrees of freedom of the variance.
+
+        Returns
+        -------
+        A pandas DataFrame with columns ``mean`` and ``var`` indexed by
+        the column names.
+        """
+        if columns is None:
+            columns = [k for k, sr in self._cols.items()
+                       if isinstance(sr._column, NumericalColumn)]
+        series = [self._cols[k] for k in columns]
+        for k, sr in zip(columns, series):
+            if not isinstance(sr._column, NumericalColumn):
+                raise TypeError('column {!r} is not numeric'.format(k))
+        numerical.prefetch_stats([sr._column for sr in series])
+        stats = [sr.mean_var(ddof=ddof) for sr in series]
+        return pd.DataFrame(stats, index=list(columns),
+                            columns=['mean', 'var'])
 
     def one_hot_encoding(self, column, prefix, cats, prefix_sep='_',
                          dtype='float64'):
@@ -571,8 +603,14 @@ class DataFrame(object):
         newnames = [prefix_sep.join([prefix, str(cat)]) for cat in cats]
         newcols = self[column].one_hot_encoding(cats=cats, dtype=dtype)
         outdf = self.copy()
+        # The new columns already share this frame's index and length, so
+        # insert them directly instead of going through ``add_column``.
         for name, col in zip(newnames, newcols):
-            outdf.add_column(name, col)
+            if name in outdf._cols:
+                raise NameError('duplicated column name {!r}'.format(name))
+            col.name = name
+            outdf._cols[name] = col
+        outdf._columns = None
         return outdf
 
     def label_encoding(self, column, prefix, cats, prefix_sep='_', dtype=None,
@@ -1026,8 +1064,11 @@ class DataFrame(object):
 
         def gather_cols(outdf, indf, idx, joinidx, suffix):
             mask = (Series(idx) != -1).as_mask()
+            # Every gathered column shares the mask; count its nulls once
+            null_count = len(idx) - cudautils.popcount_mask(mask, len(idx))
             for k in indf.columns:
-                newcol = indf[k].take(idx).set_mask(mask).set_index(joinidx)
+                newcol = indf[k].take(idx).set_mask(mask, null_count)
+                newcol = newcol.set_index(joinidx)
                 outdf[fix_name(k, suffix)] = newcol
 
         def gather_empty(outdf, indf, idx, joinidx, suffix):
@@ -1246,8 +1287,6 @@ class DataFrame(object):
             Sequence of column names. If columns is *None* (unspecified),
             all columns in the frame are used.
         """
-        from . import numerical
-
         if columns is None:
             columns = self.columns
 
@@ -1287,7 +1326,23 @@ class DataFrame(object):
         """Convert to a Pandas DataFrame.
         """
         index = self.index.to_pandas()
-        data = {c: x.to_pandas(index=index) for c, x in self._cols.items()}
+        # Numerical columns are copied to the host together so that the
+        # transfers can overlap.  Their filled device copies all exist at
+        # once, so only batch them when they fit in the staging buffer;
+        # otherwise convert one column at a time.
+        numcols = [k for k, sr in self._cols.items()
+                   if isinstance(sr._column, NumericalColumn)]
+        nbytes = sum(len(self._cols[k]) * self._cols[k].dtype.itemsize
+                     for k in numcols)
+        if nbytes > cudautils.MAX_PINNED_STAGING_SIZE:
+            numcols = []
+        arrays = cudautils.copy_all_to_host(
+            [self._cols[k].to_gpu_array(fillna='pandas') for k in numcols])
+        data = {k: pd.Series(arr, index=index)
+                for k, arr in zip(numcols, arrays)}
+        for k, sr in self._cols.items():
+            if k not in data:
+                data[k] = sr.to_pandas(index=index)
         return pd.DataFrame(data, columns=list(self._cols), index=index)
 
     @classmethod
@@ -1302,9 +1357,19 @@ class DataFrame(object):
             raise TypeError('not a pandas.DataFrame')
 
         df = cls()
+        # Numerical columns are copied to the device together so that the
+        # transfers can overlap.
+        numcols = [k for k, dtype in zip(dataframe.columns, dataframe.dtypes)
+                   if dtype.kind in 'iufb']
+        devarys = cudautils.copy_all_to_device(
+            [dataframe[k].values for k in numcols])
+        data = dict(zip(numcols, devarys))
         # Set columns
         for colk in dataframe.columns:
-            df[colk] = dataframe[colk].values
+            if colk in data:
+                df[colk] = data[colk]
+            else:
+                df[colk] = dataframe[colk].values
         # Set index
         return df.set_index(dataframe.index.values)
 
@@ -9,6 +9,8 @@ import threading
 
 from numba import cuda
 
+from . import cudautils
+
 try:
     import zmq
     _HAVE_ZMQ = True
@@ -181,7 +183,7 @@ def _request_transfer(key, remoteinfo):
         # Open IPC and copy to local context
 
         with ipch as data:
-            copied = cuda.device_array_like(data)
+            copied = cudautils.device_array_like(data)
             copied.copy_to_device(data)
 
         # Release
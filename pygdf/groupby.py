@@ -192,7 +192,7 @@ class Groupby(object):
             for newk, functor in infos.items():
                 if functor.__name__ == 'mean':
                     dev_begins = cuda.to_device(np.asarray(begin))
-                    dev_out = cuda.device_array(size, dtype=np.float64)
+                    dev_out = cudautils.device_array(size, dtype=np.float64)
                     if size > 0:
                         group_mean.forall(size)(sr.to_gpu_array(),
                                                 dev_begins,
@@ -201,7 +201,7 @@ class Groupby(object):
 
                 elif functor.__name__ == 'max':
                     dev_begins = cuda.to_device(np.asarray(begin))
-                    dev_out = cuda.device_array(size, dtype=sr.dtype)
+                    dev_out = cudautils.device_array(size, dtype=sr.dtype)
                     if size > 0:
                         group_max.forall(size)(sr.to_gpu_array(),
                                                dev_begins,
@@ -210,7 +210,7 @@ class Groupby(object):
 
                 elif functor.__name__ == 'min':
                     dev_begins = cuda.to_device(np.asarray(begin))
-                    dev_out = cuda.device_array(size, dtype=sr.dtype)
+                    dev_out = cudautils.device_array(size, dtype=sr.dtype)
                     if size > 0:
                         group_min.forall(size)(sr.to_gpu_array(),
                                                dev_begins,
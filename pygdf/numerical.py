@@ -6,7 +6,6 @@ import numpy as np
 import pandas as pd
 import pyarrow as pa
 
-from numba import cuda
 from libgdf_cffi import libgdf
 
 from . import _gdf, columnops, utils, cudautils
@@ -62,6 +61,13 @@ class NumericalColumn(columnops.TypedColumnBase):
         """
         super(NumericalColumn, self).__init__(**kwargs)
         assert self._dtype == self._data.dtype
+        # (count, mean, M2) from ``compute_stats``; see ``_get_stats``
+        self._stats = None
+
+    def __getstate__(self):
+        state = super(NumericalColumn, self).__getstate__()
+        state['_stats'] = None
+        return state
 
     def serialize(self, serialize):
         header, frames = super(NumericalColumn, self).serialize(serialize)
@@ -87,6 +93,9 @@ class NumericalColumn(columnops.TypedColumnBase):
             raise TypeError(msg.format(binop, type(self), type(rhs)))
 
     def unary_operator(self, unaryop):
+        if unaryop in ('ceil', 'floor') and self.dtype.kind in 'iu':
+            # Integers are already integral; nothing to round
+            return self
         return numeric_column_unaryop(self, op=_unary_impl[unaryop],
                                       out_dtype=self.dtype)
 
@@ -203,16 +212,30 @@ class NumericalColumn(columnops.TypedColumnBase):
         return _gdf.apply_reduce(libgdf.gdf_sum_generic, x)
 
     def mean(self):
+        if self._stats is not None:
+            # Reuse the mean from an earlier ``mean_var``
+            n, mu, _ = self._stats
+            return np.float64(mu) if n > 0 else np.nan
         return self.sum().astype('f8') / self.valid_count
 
+    def _get_stats(self):
+        """Get the cached ``(n, mean, m2)`` of ``cudautils.compute_stats``.
+
+        Computed on first use; safe to keep since the column is immutable.
+        """
+        if self._stats is None:
+            # Single-pass Welford reduction; nulls are skipped via the mask
+            mask = self.mask.to_gpu_array() if self.has_null_mask else None
+            self._stats = cudautils.compute_stats(self.data.to_gpu_array(),
+                                                  mask)
+        return self._stats
+
     def mean_var(self, ddof=1):
-        x = self.astype('f8')
-        mu = x.mean()
-        n = x.valid_count
-        asum = x.sum_of_squares()
-        div = n - ddof
-        var = asum / div - (mu ** 2) * n / div
-        return mu, var
+        n, mu, m2 = self._get_stats()
+        if n == 0:
+            return np.nan, np.nan
+        var = np.float64(m2) / (n - ddof)
+        return np.float64(mu), var
 
     def sum_of_squares(self):
         x = self.astype('f8')
@@ -390,10 +413,51 @@ def column_hash_values(column0, *other_columns):
     Returns a new NumericalColumn[int32]
     """
     columns = [column0] + list(other_columns)
-    buf = Buffer(cuda.device_array(len(column0), dtype=np.int32))
+    buf = Buffer(cudautils.device_array(len(column0), dtype=np.int32))
     result = NumericalColumn(data=buf, dtype=buf.dtype)
     _gdf.hash_columns(columns, result)
     return result
 
 
+# Columns longer than this are reduced one at a time by ``prefetch_stats``;
+# past it a reduction is bandwidth-bound and stacking only adds a copy.
+MAX_BATCHED_STATS_ROWS = 64 * 1024
+# Upper bound on the size of each matrix stacked by ``prefetch_stats``
+MAX_BATCHED_STATS_BYTES = 16 * 1024 * 1024
+
+
+def prefetch_stats(columns):
+    """Fill the ``compute_stats`` cache of the NumericalColumns *columns*.
+
+    Short null-free columns of the same dtype and length are stacked into
+    matrices of at most ``MAX_BATCHED_STATS_BYTES`` and reduced together by
+    ``cudautils.compute_stats_batched`` to save kernel launches; the rest
+    are computed one at a time.
+    """
+    for col in columns:
+        if not isinstance(col, NumericalColumn):
+            raise TypeError('expecting NumericalColumn but got {}'
+                            .format(type(col).__name__))
+    groups = {}
+    for col in columns:
+        if col._stats is not None:
+            continue
+        nrow = len(col)
+        if col.has_null_mask or not 0 < nrow <= MAX_BATCHED_STATS_ROWS:
+            col._get_stats()
+        else:
+            groups.setdefault((col.dtype, nrow), []).append(col)
+    for (dtype, nrow), cols in groups.items():
+        step = max(1, MAX_BATCHED_STATS_BYTES // (nrow * dtype.itemsize))
+        for start in range(0, len(cols), step):
+            batch = cols[start:start + step]
+            if len(batch) == 1:
+                batch[0]._get_stats()
+                continue
+            matrix = cudautils.column_matrix(batch, nrow, len(batch), dtype)
+            results = cudautils.compute_stats_batched(matrix)
+            for col, stats in zip(batch, results):
+                col._stats = stats
+
+
 register_distributed_serializer(NumericalColumn)
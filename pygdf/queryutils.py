@@ -8,6 +8,8 @@ import numpy as np
 
 from numba import cuda
 
+from . import cudautils
+
 
 ENVREF_PREFIX = '__PYGDF_ENVREF__'
 
@@ -214,7 +216,7 @@ def query_execute(df, expr, callenv):
     colarrays = [df[col].to_gpu_array() for col in compiled['colnames']]
     # allocate output buffer
     nrows = len(df)
-    out = cuda.device_array(nrows, dtype=np.bool_)
+    out = cudautils.device_array(nrows, dtype=np.bool_)
     # run kernel
     args = [out] + colarrays + envargs
     kernel.forall(nrows)(*args)
@@ -14,10 +14,27 @@ from .index import Index, RangeIndex, GenericIndex
 from .settings import NOTSET, settings
 from .column import Column
 from .datetime import DatetimeColumn
+from .numerical import NumericalColumn
 from . import columnops
 from .serialize import register_distributed_serializer
 
 
+# Read-only empty arrays by dtype; see ``_empty_array``
+_empty_arrays = {}
+
+
+def _empty_array(dtype):
+    """Return a shared, read-only empty host array of *dtype*.
+    """
+    try:
+        return _empty_arrays[dtype]
+    except KeyError:
+        arr = np.empty(0, dtype=dtype)
+        arr.flags.writeable = False
+        _empty_arrays[dtype] = arr
+        return arr
+
+
 class Series(object):
     """
     Data and null-masks.
@@ -222,7 +239,8 @@ class Series(object):
     def _get_mask_as_series(self):
         mask = Series(cudautils.ones(len(self), dtype=np.bool))
         if self._column.mask is not None:
-            mask = mask.set_mask(self._column.mask).fillna(False)
+            mask = mask.set_mask(self._column.mask,
+                                 null_count=self.null_count).fillna(False)
         return mask
 
     def __bool__(self):
@@ -234,9 +252,7 @@ class Series(object):
     def values_to_string(self, nrows=None):
         """Returns a list of string for each element.
         """
-        values = self[:nrows]
-        out = ['' if v is None else str(v) for v in values]
-        return out
+        return self._column.element_strings(nrows)
 
     def head(self, n=5):
         return self[:n]
@@ -610,14 +626,17 @@ class Series(object):
             raise TypeError('expecting integer or float dtype')
 
         dtype = np.dtype(dtype)
+        if isinstance(cats, Series):
+            cats = cats.to_gpu_array()
+        else:
+            cats = cudautils.to_device(np.asarray(cats))
+        # Encode all categories at once; each row is one output column
+        matrix = cudautils.apply_one_hot_encoding(
+            arr=self.data.to_gpu_array(), cats=cats, dtype=dtype)
         out = []
-        for cat in cats:
-            mask = None  # self.nullmask.to_gpu_array()
-            buf = cudautils.apply_equal_constant(
-                arr=self.data.to_gpu_array(),
-                mask=mask,
-                val=cat, dtype=dtype)
-            out.append(Series(buf, index=self.index))
+        for i in range(matrix.shape[0]):
+            col = NumericalColumn(data=Buffer(matrix[i]), dtype=dtype)
+            out.append(Series(col, index=self.index))
         return out
 
     def label_encoding(self, cats, dtype=None, na_sentinel=-1):
@@ -785,7 +804,7 @@ class Series(object):
             msg = 'not sorted unique not implemented yet.'
             raise NotImplementedError(msg)
         if self.null_count == len(self):
-            return np.empty(0, dtype=self.dtype)
+            return _empty_array(self.dtype)
         res = self._column.unique(method=method)
         return Series(res)
 
@@ -821,9 +840,11 @@ class Series(object):
         if self.null_count != 0:
             msg = 'masked series not supported by this operation'
             raise NotImplementedError(msg)
-        vmin = self.min()
-        vmax = self.max()
         gpuarr = self.to_gpu_array()
+        if gpuarr.size == 0:
+            return Series(cudautils.device_array(0, dtype=np.float64))
+        # The bounds stay on the device
+        vmin, vmax = cudautils.compute_minmax_device(gpuarr)
         scaled = cudautils.compute_scale(gpuarr, vmin, vmax)
         return Series(scaled)
 
@@ -0,0 +1,69 @@
+# Copyright (c) 2018, NVIDIA CORPORATION.
+
+import threading
+
+import pytest
+
+import numpy as np
+from numba import cuda
+
+from pygdf import cudautils
+
+
+def test_device_array_without_rmm(monkeypatch):
+    monkeypatch.setattr(cudautils, '_rmm_device_array', None)
+    arr = cudautils.device_array((3, 4), dtype=np.int32, order='F')
+    assert cuda.devicearray.is_cuda_ndarray(arr)
+    assert arr.shape == (3, 4)
+    assert arr.dtype == np.int32
+    assert arr.is_f_contiguous()
+    with pytest.raises(ImportError):
+        cudautils.use_rmm_pool()
+
+
+def test_device_array_with_rmm(monkeypatch):
+    calls = []
+
+    def fake_device_array(shape, dtype, order):
+        calls.append((shape, dtype, order))
+        return cuda.device_array(shape, dtype=dtype, order=order)
+
+    monkeypatch.setattr(cudautils, '_rmm_device_array', fake_device_array)
+    arr = cudautils.device_array(5, dtype=np.float32)
+    assert arr.size == 5
+    assert calls == [(5, np.float32, 'C')]
+
+
+@pytest.mark.parametrize('tiled', [False, True])
+def test_concurrent_transfers(monkeypatch, tiled):
+    if tiled:
+        # Send every transfer through the double-buffered tiles
+        monkeypatch.setattr(cudautils, 'TRANSFER_TILE_SIZE', 256)
+        monkeypatch.setattr(cudautils, 'MAX_PINNED_STAGING_SIZE', 512)
+    nthreads = 4
+    errors = []
+
+    def work(seed):
+        # Same-sized arrays share a staging size class across threads
+        arr = np.arange(1000, dtype=np.float64) + seed
+        try:
+            for _ in range(20):
+                dev = cudautils.copy_to_device(arr)
+                got = cudautils.copy_to_host(dev)
+                np.testing.assert_equal(got, arr)
+                got = cudautils.copy_all_to_host(
+                    cudautils.copy_all_to_device([arr, arr[:10]]))
+                np.testing.assert_equal(got[0], arr)
+                np.testing.assert_equal(got[1], arr[:10])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(i,))
+               for i in range(nthreads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    pooled = sum(buf.size for buf in cudautils._pinned_staging_pool)
+    assert pooled <= cudautils.MAX_PINNED_STAGING_POOL
@@ -338,6 +338,18 @@ def test_dataframe_to_string():
         assert got.split() == expect.split()
 
 
+def test_series_values_to_string_masked():
+    data = np.arange(10)
+    mask = np.zeros(2, dtype=np.uint8)
+    mask[0] = 0b10110101
+    mask[1] = 0b00000010
+    sr = Series.from_masked_array(data, mask)
+    expect = [str(v) if valid else ''
+              for v, valid in zip(data, utils.expand_bits_to_bytes(mask))]
+    assert sr.values_to_string() == expect
+    assert sr.values_to_string(nrows=4) == expect[:4]
+
+
 def test_dataframe_to_string_wide():
     # Test basic
     df = DataFrame()
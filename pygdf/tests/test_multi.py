@@ -90,3 +90,14 @@ def test_concat_misordered_columns():
     sol = pd.concat([df, df2])
 
     pd.util.testing.assert_frame_equal(res, sol, check_names=False)
+
+
+def test_concat_masked_series():
+    s1 = pd.Series([1.0, None, 3.0, 4.0, None])
+    s2 = pd.Series([6.0, 7.0, 8.0])
+    s3 = pd.Series([None, 10.0, 11.0, None, 13.0, 14.0, 15.0, None, 17.0])
+    sol = pd.concat([s1, s2, s3])
+    res = gd.concat([gd.Series(s1), gd.Series(s2), gd.Series(s3)])
+    assert res.null_count == sol.isnull().sum()
+    pd.util.testing.assert_series_equal(res.to_pandas(), sol,
+                                        check_names=False)
@@ -50,6 +50,22 @@ def test_pickle_dataframe_categorical():
     check_serialization(df)
 
 
+def test_pickle_after_libgdf_calls():
+    np.random.seed(0)
+    df = DataFrame()
+    nelem = 10
+    df['keys'] = np.arange(nelem, dtype=np.float64)
+    df['vals'] = np.random.random(nelem)
+    # Reductions and sorting go through libgdf views of the columns
+    df['vals'].sum()
+    df['vals'].max()
+    assert_frame_picklable(df)
+
+    sr = df['vals'].sort_values()
+    loaded = pickle.loads(pickle.dumps(sr))
+    np.testing.assert_equal(loaded.to_array(), sr.to_array())
+
+
 def test_sizeof_dataframe():
     np.random.seed(0)
     df = DataFrame()
@@ -66,6 +66,17 @@ def test_to_dense_array():
     assert filled.size == len(sr)
 
 
+def test_masked_element_indexing():
+    data = np.arange(10, dtype=np.float64)
+    mask = np.asarray([0b11010110, 0b00000001], dtype=np.uint8)
+
+    sr = Series.from_masked_array(data=data, mask=mask, null_count=4)
+    expect = [None, 1, 2, None, 4, None, 6, 7, 8, None]
+    assert [sr[i] for i in range(len(sr))] == expect
+    # negative indices read the bit of the matching positive index
+    assert [sr[i] for i in range(-len(sr), 0)] == expect
+
+
 @pytest.mark.skipif(arrow_version is None,
                     reason='need compatible pyarrow to generate test data')
 def test_reading_arrow_sparse_data():
@@ -1,11 +1,13 @@
 # Copyright (c) 2018, NVIDIA CORPORATION.
 
+import warnings
+
 import pytest
 
 import numpy as np
 import pandas as pd
 
-from pygdf.dataframe import Series
+from pygdf.dataframe import DataFrame, Series
 
 
 params_dtypes = [np.int32, np.float32, np.float64]
@@ -50,6 +52,64 @@ def test_series_std(ddof):
     np.testing.assert_approx_equal(expect, got)
 
 
+def test_series_var_large_offset():
+    np.random.seed(0)
+    arr = np.random.random(1000) + 1e8
+    sr = Series(arr)
+    np.testing.assert_approx_equal(arr.var(ddof=1), sr.var())
+
+
+def test_series_mean_after_var_single_element():
+    sr = Series(np.asarray([3.5]))
+    with np.errstate(all='ignore'):
+        sr.var()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert sr.mean() == 3.5
+
+
+def test_series_stats_int8_mask():
+    arr = np.arange(20, dtype=np.float64)
+    mask = np.asarray([-1, 0x0f, 0], dtype=np.int8)
+    sr = Series.from_masked_array(arr, mask)
+    np.testing.assert_approx_equal(arr[:12].mean(), sr.mean())
+    np.testing.assert_approx_equal(arr[:12].var(ddof=1), sr.var())
+
+
+def test_series_var_float32_large_offset():
+    np.random.seed(0)
+    arr = (np.random.random(1000) + 1e4).astype(np.float32)
+    sr = Series(arr)
+    expect = arr.astype(np.float64).var(ddof=1)
+    np.testing.assert_allclose(expect, sr.var(), rtol=1e-6)
+    np.testing.assert_allclose(np.sqrt(expect), sr.std(), rtol=1e-6)
+
+
+@pytest.mark.parametrize('ddof', range(3))
+def test_dataframe_mean_var(ddof):
+    np.random.seed(0)
+    pdf = pd.DataFrame({'a': np.random.random(1000),
+                        'b': np.random.random(1000) * 100,
+                        'c': np.random.randint(0, 50, 1000),
+                        'd': np.random.random(1000) - 0.5})
+    pdf.loc[::7, 'd'] = np.nan
+    df = DataFrame.from_pandas(pdf)
+    got = df.mean_var(ddof=ddof)
+    assert list(got.index) == list('abcd')
+    np.testing.assert_allclose(got['mean'], pdf.mean())
+    np.testing.assert_allclose(got['var'], pdf.var(ddof=ddof))
+
+
+def test_dataframe_mean_var_non_numeric():
+    df = DataFrame()
+    df['a'] = np.arange(10, dtype=np.float64)
+    df['b'] = pd.Categorical(list('abcabcabca'))
+    got = df.mean_var()
+    assert list(got.index) == ['a']
+    with pytest.raises(TypeError):
+        df.mean_var(columns=['a', 'b'])
+
+
 def test_series_unique():
     for size in [10 ** x for x in range(5)]:
         arr = np.random.randint(low=-1, high=10, size=size)
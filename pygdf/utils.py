@@ -2,10 +2,13 @@ from collections import namedtuple
 
 import numpy as np
 
-from numba import njit, cuda
+from numba import njit
 
 mask_dtype = np.dtype(np.uint8)
 mask_bitsize = mask_dtype.itemsize * 8
+# log2(mask_bitsize), for computing mask sizes with a shift
+mask_bitshift = mask_bitsize.bit_length() - 1
+assert 1 << mask_bitshift == mask_bitsize
 
 
 def calc_chunk_size(size, chunksize):
@@ -35,11 +38,54 @@ def mask_set(mask, pos):
     mask[pos // mask_bitsize] |= 1 << (pos % mask_bitsize)
 
 
+def host_expand_mask_bits(size, bits):
+    """Expand the host bitmask *bits* into a boolean array of *size*
+    elements.
+    """
+    idx = np.arange(size)
+    return ((bits[idx // mask_bitsize] >> (idx % mask_bitsize)) & 1) != 0
+
+
+def host_compact_mask_bytes(bools):
+    """Pack the host boolean array *bools* into a bitmask.
+    """
+    size = calc_chunk_size(bools.size, mask_bitsize) * mask_bitsize
+    padded = np.zeros(size, dtype=np.bool_)
+    padded[:bools.size] = bools
+    # np.packbits is big-endian in bit order; the mask is little-endian
+    bits = np.packbits(padded.reshape(-1, mask_bitsize)[:, ::-1], axis=1)
+    return bits.reshape(-1).astype(mask_dtype)
+
+
+def host_popcount(bits, size):
+    """Count the set bits among the first *size* bits of the host bitmask
+    *bits*.
+
+    The bytes are viewed as 64-bit words and counted with a vectorized
+    SWAR popcount.
+    """
+    nbytes = calc_chunk_size(size, mask_bitsize)
+    words = np.zeros(calc_chunk_size(nbytes, 8), dtype=np.uint64)
+    raw = words.view(np.uint8)
+    raw[:nbytes] = bits[:nbytes]
+    if size % mask_bitsize:
+        # clear the bits past *size*
+        raw[nbytes - 1] &= (1 << (size % mask_bitsize)) - 1
+    x = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = ((x & np.uint64(0x3333333333333333)) +
+         ((x >> np.uint64(2)) & np.uint64(0x3333333333333333)))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0f0f0f0f0f0f0f0f)
+    x = (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+    return int(x.sum())
+
+
 def make_mask(size):
     """Create mask to obtain at least *size* number of bits.
     """
-    size = calc_chunk_size(size, mask_bitsize)
-    return cuda.device_array(shape=size, dtype=mask_dtype)
+    from .cudautils import device_array
+
+    nelem = (size + mask_bitsize - 1) >> mask_bitshift
+    return device_array(shape=nelem, dtype=mask_dtype)
 
 
 def require_writeable_array(arr):
@@ -48,11 +94,11 @@ def require_writeable_array(arr):
 
 
 def scalar_broadcast_to(scalar, shape, dtype):
-    from .cudautils import fill_value
+    from .cudautils import device_array, fill_value
 
     if not isinstance(shape, tuple):
         shape = (shape,)
-    da = cuda.device_array(shape, dtype=dtype)
+    da = device_array(shape, dtype=dtype)
     if da.size != 0:
         fill_value(da, scalar)
     return da